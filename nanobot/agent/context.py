@@ -23,6 +23,7 @@ class ContextBuilder:
         self.memory = MemoryStore(workspace)
         self.skills = SkillsLoader(workspace)
         self.swarm_enabled = swarm_enabled
+        self._identity: str | None = None  # Static per workspace; built on first use
     
     def build_system_prompt(self, skill_names: list[str] | None = None) -> str:
         """Build the system prompt from identity, bootstrap files, memory, and skills."""
@@ -54,7 +55,13 @@ Skills with available="false" need dependencies installed first - you can try in
         return "\n\n---\n\n".join(parts)
     
     def _get_identity(self) -> str:
-        """Get the core identity section."""
+        """Get the core identity section (cached — it only depends on workspace and platform)."""
+        if self._identity is None:
+            self._identity = self._build_identity()
+        return self._identity
+
+    def _build_identity(self) -> str:
+        """Build the core identity section."""
         workspace_path = str(self.workspace.expanduser().resolve())
         system = platform.system()
         runtime = f"{'macOS' if system == 'Darwin' else system} {platform.machine()}, Python {platform.python_version()}"
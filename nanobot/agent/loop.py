@@ -20,7 +20,7 @@ from nanobot.agent.tools.message import MessageTool
 from nanobot.agent.tools.registry import ToolRegistry
 from nanobot.agent.tools.shell import ExecTool
 from nanobot.agent.tools.spawn import SpawnTool
-from nanobot.agent.tools.web import WebFetchTool, WebSearchTool
+from nanobot.agent.tools.web import WebFetchTool, WebSearchTool, new_http_client
 from nanobot.bus.events import InboundMessage, OutboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.providers.base import LLMProvider
@@ -30,6 +30,8 @@ if TYPE_CHECKING:
     from nanobot.config.schema import ChannelsConfig, ExecToolConfig, SwarmConfig
     from nanobot.cron.service import CronService
 
+_THINK_RE = re.compile(r"<think>[\s\S]*?</think>")
+
 
 class AgentLoop:
     """
@@ -85,6 +87,7 @@ class AgentLoop:
         )
         self.sessions = session_manager or SessionManager(workspace)
         self.tools = ToolRegistry()
+        self._http_client = new_http_client()  # Keep-alive pool shared by the web tools
         self.subagents = SubagentManager(
             provider=provider,
             workspace=workspace,
@@ -98,6 +101,7 @@ class AgentLoop:
         )
 
         self._running = False
+        self._stop_event = asyncio.Event()
         self._mcp_servers = mcp_servers or {}
         self._mcp_stack: AsyncExitStack | None = None
         self._mcp_connected = False
@@ -107,6 +111,9 @@ class AgentLoop:
         self._consolidation_locks: dict[str, asyncio.Lock] = {}
         self._active_tasks: dict[str, list[asyncio.Task]] = {}  # session_key -> tasks
         self._processing_lock = asyncio.Lock()
+        self._dirty_sessions: dict[str, Session] = {}  # Sessions awaiting a write-behind save
+        self._save_tasks: dict[str, asyncio.Task] = {}  # session_key -> in-flight save task
+        self._writing: dict[str, Session] = {}  # Sessions whose file write has not finished
         self._swarm_config = swarm_config
         self._register_default_tools()
 
@@ -121,8 +128,8 @@ class AgentLoop:
             restrict_to_workspace=self.restrict_to_workspace,
             path_append=self.exec_config.path_append,
         ))
-        self.tools.register(WebSearchTool(api_key=self.brave_api_key))
-        self.tools.register(WebFetchTool())
+        self.tools.register(WebSearchTool(api_key=self.brave_api_key, client=self._http_client))
+        self.tools.register(WebFetchTool(client=self._http_client))
         self.tools.register(MessageTool(send_callback=self.bus.publish_outbound))
         self.tools.register(SpawnTool(manager=self.subagents))
         if self.cron_service:
@@ -156,6 +163,7 @@ class AgentLoop:
             agent_pool=agent_pool,
             model=self.model,
             max_tokens=self.max_tokens,
+            max_concurrency=self._swarm_config.max_concurrency,
         )
         self.tools.register(SwarmTool(orchestrator))
         logger.info("Jarvis swarm tool registered with {} roles: {}",
@@ -195,7 +203,7 @@ class AgentLoop:
         """Remove <think>…</think> blocks that some models embed in content."""
         if not text:
             return None
-        return re.sub(r"<think>[\s\S]*?</think>", "", text).strip() or None
+        return _THINK_RE.sub("", text).strip() or None
 
     @staticmethod
     def _tool_hint(tool_calls: list) -> str:
@@ -217,6 +225,7 @@ class AgentLoop:
         iteration = 0
         final_content = None
         tools_used: list[str] = []
+        tool_memo: dict[tuple[str, str], str] = {}  # Read-only results reused within this run
 
         while iteration < self.max_iterations:
             iteration += 1
@@ -252,11 +261,14 @@ class AgentLoop:
                     reasoning_content=response.reasoning_content,
                 )
 
-                for tool_call in response.tool_calls:
+                for tool_call, call_dict in zip(response.tool_calls, tool_call_dicts):
                     tools_used.append(tool_call.name)
-                    args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
+                    args_str = call_dict["function"]["arguments"]
                     logger.info("Tool call: {}({})", tool_call.name, args_str[:200])
-                    result = await self.tools.execute(tool_call.name, tool_call.arguments)
+                results = await self.tools.execute_many(
+                    [(tc.name, tc.arguments) for tc in response.tool_calls], memo=tool_memo,
+                )
+                for tool_call, result in zip(response.tool_calls, results):
                     messages = self.context.add_tool_result(
                         messages, tool_call.id, tool_call.name, result
                     )
@@ -280,21 +292,33 @@ class AgentLoop:
     async def run(self) -> None:
         """Run the agent loop, dispatching messages as tasks to stay responsive to /stop."""
         self._running = True
+        self._stop_event.clear()
         await self._connect_mcp()
         logger.info("Agent loop started")
 
-        while self._running:
-            try:
-                msg = await asyncio.wait_for(self.bus.consume_inbound(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
-
-            if msg.content.strip().lower() == "/stop":
-                await self._handle_stop(msg)
-            else:
-                task = asyncio.create_task(self._dispatch(msg))
-                self._active_tasks.setdefault(msg.session_key, []).append(task)
-                task.add_done_callback(lambda t, k=msg.session_key: self._active_tasks.get(k, []) and self._active_tasks[k].remove(t) if t in self._active_tasks.get(k, []) else None)
+        # Block on the bus until a message arrives or stop() is called — no idle polling
+        stop_waiter = asyncio.create_task(self._stop_event.wait())
+        try:
+            while self._running:
+                consume = asyncio.create_task(self.bus.consume_inbound())
+                try:
+                    await asyncio.wait((consume, stop_waiter), return_when=asyncio.FIRST_COMPLETED)
+                except asyncio.CancelledError:
+                    consume.cancel()
+                    raise
+                if not consume.done():
+                    consume.cancel()
+                    break
+                msg = consume.result()
+
+                if msg.content.strip().lower() == "/stop":
+                    await self._handle_stop(msg)
+                else:
+                    task = asyncio.create_task(self._dispatch(msg))
+                    self._active_tasks.setdefault(msg.session_key, []).append(task)
+                    task.add_done_callback(lambda t, k=msg.session_key: self._active_tasks.get(k, []) and self._active_tasks[k].remove(t) if t in self._active_tasks.get(k, []) else None)
+        finally:
+            stop_waiter.cancel()
 
     async def _handle_stop(self, msg: InboundMessage) -> None:
         """Cancel all active tasks and subagents for the session."""
@@ -343,9 +367,15 @@ class AgentLoop:
                 pass  # MCP SDK cancel scope cleanup is noisy but harmless
             self._mcp_stack = None
 
+    async def close(self) -> None:
+        """Release MCP connections and the shared HTTP client."""
+        await self.close_mcp()
+        await self._http_client.aclose()
+
     def stop(self) -> None:
         """Stop the agent loop."""
         self._running = False
+        self._stop_event.set()
         logger.info("Agent loop stopping")
 
     async def _process_message(
@@ -355,10 +385,14 @@ class AgentLoop:
         on_progress: Callable[[str], Awaitable[None]] | None = None,
     ) -> OutboundMessage | None:
         """Process a single inbound message and return the response."""
-        # System messages: parse origin from chat_id ("channel:chat_id")
+        # System messages: route to the origin fields, else parse chat_id ("channel:chat_id")
         if msg.channel == "system":
-            channel, chat_id = (msg.chat_id.split(":", 1) if ":" in msg.chat_id
-                                else ("cli", msg.chat_id))
+            if msg.origin_channel and msg.origin_chat_id:
+                channel, chat_id = msg.origin_channel, msg.origin_chat_id
+            else:
+                channel, sep, chat_id = msg.chat_id.partition(":")
+                if not sep:
+                    channel, chat_id = "cli", msg.chat_id
             logger.info("Processing system message from {}", msg.sender_id)
             key = f"{channel}:{chat_id}"
             session = self.sessions.get_or_create(key)
@@ -370,7 +404,7 @@ class AgentLoop:
             )
             final_content, _, all_msgs = await self._run_agent_loop(messages)
             self._save_turn(session, all_msgs, 1 + len(history))
-            self.sessions.save(session)
+            self._schedule_save(session)
             return OutboundMessage(channel=channel, chat_id=chat_id,
                                   content=final_content or "Background task completed.")
 
@@ -408,7 +442,7 @@ class AgentLoop:
                     self._consolidation_locks.pop(session.key, None)
 
             session.clear()
-            self.sessions.save(session)
+            await self._save_now(session)  # Must hit disk before the cache entry is dropped
             self.sessions.invalidate(session.key)
             return OutboundMessage(channel=msg.channel, chat_id=msg.chat_id,
                                   content="New session started.")
@@ -465,7 +499,7 @@ class AgentLoop:
             final_content = "I've completed processing but have no response to give."
 
         self._save_turn(session, all_msgs, 1 + len(history))
-        self.sessions.save(session)
+        self._schedule_save(session)
 
         if (mt := self.tools.get("message")) and isinstance(mt, MessageTool) and mt._sent_in_turn:
             return None
@@ -498,6 +532,52 @@ class AgentLoop:
             session.messages.append(entry)
         session.updated_at = datetime.now()
 
+    def _schedule_save(self, session: Session) -> None:
+        """Persist a session in the background; bursts of saves per session are coalesced."""
+        self._dirty_sessions[session.key] = session
+        if session.key not in self._save_tasks:
+            self._save_tasks[session.key] = asyncio.create_task(self._flush_session(session.key))
+
+    async def _flush_session(self, key: str) -> None:
+        """Write the latest state of a session until no newer save is pending."""
+        try:
+            while (session := self._dirty_sessions.pop(key, None)) is not None:
+                try:
+                    await self._write_session(session)
+                except Exception:
+                    logger.exception("Failed to save session {}", key)
+        finally:
+            self._save_tasks.pop(key, None)
+
+    async def _write_session(self, session: Session) -> None:
+        """Serialize on the loop, where the session is mutated, and write from a thread."""
+        data = self.sessions.dumps(session)
+        self._writing[session.key] = session
+        try:
+            await asyncio.to_thread(self.sessions.write, session.key, data)
+        finally:
+            self._writing.pop(session.key, None)
+
+    async def _save_now(self, session: Session) -> None:
+        """Save a session after any in-flight write, raising if the save fails."""
+        self._dirty_sessions.pop(session.key, None)
+        if task := self._save_tasks.get(session.key):
+            await task
+        await self._write_session(session)
+
+    async def flush_sessions(self) -> None:
+        """Wait for all pending session saves to reach disk."""
+        while self._save_tasks:
+            await asyncio.gather(*self._save_tasks.values(), return_exceptions=True)
+
+    def flush_sessions_now(self) -> None:
+        """Synchronously save every session with a pending or unfinished write, for hard exits."""
+        for session in {**self._writing, **self._dirty_sessions}.values():
+            try:
+                self.sessions.save(session)
+            except Exception:
+                logger.exception("Failed to save session {}", session.key)
+
     async def _consolidate_memory(self, session, archive_all: bool = False) -> bool:
         """Delegate to MemoryStore.consolidate(). Returns True on success."""
         return await MemoryStore(self.workspace).consolidate(
@@ -517,4 +597,5 @@ class AgentLoop:
         await self._connect_mcp()
         msg = InboundMessage(channel=channel, sender_id="user", chat_id=chat_id, content=content)
         response = await self._process_message(msg, session_key=session_key, on_progress=on_progress)
+        await self.flush_sessions()
         return response.content if response else ""
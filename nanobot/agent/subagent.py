@@ -147,10 +147,13 @@ class SubagentManager:
                     })
                     
                     # Execute tools
-                    for tool_call in response.tool_calls:
-                        args_str = json.dumps(tool_call.arguments, ensure_ascii=False)
+                    for tool_call, call_dict in zip(response.tool_calls, tool_call_dicts):
+                        args_str = call_dict["function"]["arguments"]
                         logger.debug("Subagent [{}] executing: {} with arguments: {}", task_id, tool_call.name, args_str)
-                        result = await tools.execute(tool_call.name, tool_call.arguments)
+                    results = await tools.execute_many(
+                        [(tc.name, tc.arguments) for tc in response.tool_calls]
+                    )
+                    for tool_call, result in zip(response.tool_calls, results):
                         messages.append({
                             "role": "tool",
                             "tool_call_id": tool_call.id,
@@ -199,6 +202,8 @@ Summarize this naturally for the user. Keep it brief (1-2 sentences). Do not men
             sender_id="subagent",
             chat_id=f"{origin['channel']}:{origin['chat_id']}",
             content=announce_content,
+            origin_channel=origin["channel"],
+            origin_chat_id=origin["chat_id"],
         )
         
         await self.bus.publish_inbound(msg)
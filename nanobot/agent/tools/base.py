@@ -20,6 +20,9 @@ class Tool(ABC):
         "array": list,
         "object": dict,
     }
+
+    # Read-only tools have no side effects, so calls to them may run concurrently
+    read_only: bool = False
     
     @property
     @abstractmethod
@@ -52,6 +55,10 @@ class Tool(ABC):
         """
         pass
 
+    def is_cacheable(self, result: str) -> bool:
+        """Whether a read-only result may be reused for an identical call in the same turn."""
+        return self.read_only and not result.startswith("Error")
+
     def validate_params(self, params: dict[str, Any]) -> list[str]:
         """Validate tool parameters against JSON schema. Returns error list (empty if valid)."""
         schema = self.parameters or {}
@@ -24,6 +24,8 @@ def _resolve_path(path: str, workspace: Path | None = None, allowed_dir: Path |
 class ReadFileTool(Tool):
     """Tool to read file contents."""
 
+    read_only = True
+
     def __init__(self, workspace: Path | None = None, allowed_dir: Path | None = None):
         self._workspace = workspace
         self._allowed_dir = allowed_dir
@@ -196,6 +198,8 @@ class EditFileTool(Tool):
 class ListDirTool(Tool):
     """Tool to list directory contents."""
 
+    read_only = True
+
     def __init__(self, workspace: Path | None = None, allowed_dir: Path | None = None):
         self._workspace = workspace
         self._allowed_dir = allowed_dir
@@ -1,5 +1,7 @@
 """Tool registry for dynamic tool management."""
 
+import asyncio
+import json
 from typing import Any
 
 from nanobot.agent.tools.base import Tool
@@ -14,14 +16,17 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._definitions: list[dict[str, Any]] | None = None  # Cached schemas, reset on change
     
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._definitions = None
     
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
         self._tools.pop(name, None)
+        self._definitions = None
     
     def get(self, name: str) -> Tool | None:
         """Get a tool by name."""
@@ -33,7 +38,9 @@ class ToolRegistry:
     
     def get_definitions(self) -> list[dict[str, Any]]:
         """Get all tool definitions in OpenAI format."""
-        return [tool.to_schema() for tool in self._tools.values()]
+        if self._definitions is None:
+            self._definitions = [tool.to_schema() for tool in self._tools.values()]
+        return list(self._definitions)
     
     async def execute(self, name: str, params: dict[str, Any]) -> str:
         """Execute a tool by name with given parameters."""
@@ -54,6 +61,57 @@ class ToolRegistry:
         except Exception as e:
             return f"Error executing {name}: {str(e)}" + _HINT
     
+    async def execute_many(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        memo: dict[tuple[str, str], str] | None = None,
+    ) -> list[str]:
+        """
+        Execute tool calls, returning results in call order.
+
+        Consecutive calls to read-only tools run concurrently; any other call
+        runs on its own, so side effects stay ordered as the model requested.
+
+        If `memo` is given, read-only results the tool reports as cacheable
+        (see Tool.is_cacheable) are stored in it and reused for identical later
+        calls. Any other tool call clears it, since it may have changed what a
+        read would return.
+        """
+        results: list[str] = []
+        batch: list[tuple[str, dict[str, Any]]] = []
+        for name, params in calls:
+            tool = self._tools.get(name)
+            if tool is not None and tool.read_only:
+                batch.append((name, params))
+                continue
+            if batch:
+                results.extend(await self._execute_reads(batch, memo))
+                batch.clear()
+            if memo is not None:
+                memo.clear()
+            results.append(await self.execute(name, params))
+        if batch:
+            results.extend(await self._execute_reads(batch, memo))
+        return results
+
+    async def _execute_reads(
+        self,
+        batch: list[tuple[str, dict[str, Any]]],
+        memo: dict[tuple[str, str], str] | None,
+    ) -> list[str]:
+        """Run read-only calls concurrently, skipping ones already answered in `memo`."""
+        if memo is None:
+            return list(await asyncio.gather(*(self.execute(n, p) for n, p in batch)))
+
+        keys = [(n, json.dumps(p, sort_keys=True, default=str)) for n, p in batch]
+        pending = {k: p for k, (_, p) in zip(keys, batch) if k not in memo}
+        fresh = await asyncio.gather(*(self.execute(k[0], p) for k, p in pending.items()))
+        done = dict(zip(pending, fresh))
+        for key, result in done.items():
+            if isinstance(result, str) and self._tools[key[0]].is_cacheable(result):
+                memo[key] = result
+        return [done[k] if k in done else memo[k] for k in keys]
+
     @property
     def tool_names(self) -> list[str]:
         """Get list of registered tool names."""
@@ -4,7 +4,9 @@ import html
 import json
 import os
 import re
-from typing import Any
+from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, AsyncIterator
 from urllib.parse import urlparse
 
 import httpx
@@ -43,10 +45,32 @@ def _validate_url(url: str) -> tuple[bool, str]:
         return False, str(e)
 
 
+def new_http_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    """
+    Create a client suitable for sharing between the web tools.
+
+    The client is shared by every chat, so it never stores cookies: a
+    Set-Cookie from one user's fetch must not be sent on another's.
+    """
+    no_cookies = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    return httpx.AsyncClient(max_redirects=MAX_REDIRECTS, cookies=no_cookies, transport=transport)
+
+
+@asynccontextmanager
+async def _client_scope(shared: httpx.AsyncClient | None) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client if there is one, else a short-lived client for this call."""
+    if shared is not None:
+        yield shared
+        return
+    async with new_http_client() as client:
+        yield client
+
+
 class WebSearchTool(Tool):
     """Search the web using Brave Search API."""
     
     name = "web_search"
+    read_only = True
     description = "Search the web. Returns titles, URLs, and snippets."
     parameters = {
         "type": "object",
@@ -57,9 +81,15 @@ class WebSearchTool(Tool):
         "required": ["query"]
     }
     
-    def __init__(self, api_key: str | None = None, max_results: int = 5):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_results: int = 5,
+        client: httpx.AsyncClient | None = None,
+    ):
         self._init_api_key = api_key
         self.max_results = max_results
+        self._client = client  # Shared keep-alive client; None = one client per call
 
     @property
     def api_key(self) -> str:
@@ -76,7 +106,7 @@ class WebSearchTool(Tool):
         
         try:
             n = min(max(count or self.max_results, 1), 10)
-            async with httpx.AsyncClient() as client:
+            async with _client_scope(self._client) as client:
                 r = await client.get(
                     "https://api.search.brave.com/res/v1/web/search",
                     params={"q": query, "count": n},
@@ -103,6 +133,7 @@ class WebFetchTool(Tool):
     """Fetch and extract content from a URL using Readability."""
     
     name = "web_fetch"
+    read_only = True
     description = "Fetch URL and extract readable content (HTML → markdown/text)."
     parameters = {
         "type": "object",
@@ -114,8 +145,9 @@ class WebFetchTool(Tool):
         "required": ["url"]
     }
     
-    def __init__(self, max_chars: int = 50000):
+    def __init__(self, max_chars: int = 50000, client: httpx.AsyncClient | None = None):
         self.max_chars = max_chars
+        self._client = client  # Shared keep-alive client; None = one client per call
     
     async def execute(self, url: str, extractMode: str = "markdown", maxChars: int | None = None, **kwargs: Any) -> str:
         from readability import Document
@@ -128,12 +160,10 @@ class WebFetchTool(Tool):
             return json.dumps({"error": f"URL validation failed: {error_msg}", "url": url}, ensure_ascii=False)
 
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True,
-                max_redirects=MAX_REDIRECTS,
-                timeout=30.0
-            ) as client:
-                r = await client.get(url, headers={"User-Agent": USER_AGENT})
+            async with _client_scope(self._client) as client:
+                r = await client.get(
+                    url, headers={"User-Agent": USER_AGENT}, follow_redirects=True, timeout=30.0,
+                )
                 r.raise_for_status()
             
             ctype = r.headers.get("content-type", "")
@@ -159,6 +189,10 @@ class WebFetchTool(Tool):
         except Exception as e:
             return json.dumps({"error": str(e), "url": url}, ensure_ascii=False)
     
+    def is_cacheable(self, result: str) -> bool:
+        # Failures come back as JSON with an "error" key, not an "Error" prefix
+        return not result.startswith('{"error"')
+
     def _to_markdown(self, html: str) -> str:
         """Convert HTML to markdown."""
         # Convert links, headings, lists before stripping tags
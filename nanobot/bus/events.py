@@ -17,6 +17,8 @@ class InboundMessage:
     media: list[str] = field(default_factory=list)  # Media URLs
     metadata: dict[str, Any] = field(default_factory=dict)  # Channel-specific data
     session_key_override: str | None = None  # Optional override for thread-scoped sessions
+    origin_channel: str | None = None  # For system messages: channel to reply on
+    origin_chat_id: str | None = None  # For system messages: chat to reply to
     
     @property
     def session_key(self) -> str:
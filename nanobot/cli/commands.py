@@ -229,6 +229,15 @@ def _create_workspace_templates(workspace: Path):
     (workspace / "skills").mkdir(exist_ok=True)
 
 
+def _run_async(main):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:  # optional; also absent on free-threaded builds
+        return asyncio.run(main)
+    return uvloop.run(main)
+
+
 def _make_provider(config: Config):
     """Create the appropriate LLM provider from config."""
     from nanobot.providers.litellm_provider import LiteLLMProvider
@@ -417,13 +426,14 @@ def gateway(
         except KeyboardInterrupt:
             console.print("\nShutting down...")
         finally:
-            await agent.close_mcp()
+            await agent.flush_sessions()
+            await agent.close()
             heartbeat.stop()
             cron.stop()
             agent.stop()
             await channels.stop_all()
     
-    asyncio.run(run())
+    _run_async(run())
 
 
 
@@ -501,9 +511,9 @@ def agent(
             with _thinking_ctx():
                 response = await agent_loop.process_direct(message, session_id, on_progress=_cli_progress)
             _print_agent_response(response, render_markdown=markdown)
-            await agent_loop.close_mcp()
+            await agent_loop.close()
 
-        asyncio.run(run_once())
+        _run_async(run_once())
     else:
         # Interactive mode — route through bus like other channels
         from nanobot.bus.events import InboundMessage
@@ -516,6 +526,7 @@ def agent(
             cli_channel, cli_chat_id = "cli", session_id
 
         def _exit_on_sigint(signum, frame):
+            agent_loop.flush_sessions_now()  # os._exit skips the write-behind flush below
             _restore_terminal()
             console.print("\nGoodbye!")
             os._exit(0)
@@ -596,9 +607,10 @@ def agent(
                 agent_loop.stop()
                 outbound_task.cancel()
                 await asyncio.gather(bus_task, outbound_task, return_exceptions=True)
-                await agent_loop.close_mcp()
+                await agent_loop.flush_sessions()
+                await agent_loop.close()
 
-        asyncio.run(run_interactive())
+        _run_async(run_interactive())
 
 
 # ============================================================================
@@ -988,7 +1000,10 @@ def cron_run(
     service.on_job = on_job
 
     async def run():
-        return await service.run_job(job_id, force=force)
+        try:
+            return await service.run_job(job_id, force=force)
+        finally:
+            await agent_loop.close()
 
     if asyncio.run(run()):
         console.print("[green]✓[/green] Job executed")
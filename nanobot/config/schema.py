@@ -308,6 +308,8 @@ class SwarmConfig(Base):
     """Jarvis agent swarm configuration."""
 
     enabled: bool = False  # Set to true to enable the swarm tool
+    # Max agents running at once (default: max(CPUs, 4))
+    max_concurrency: int | None = Field(default=None, ge=1)
 
 
 class Config(BaseSettings):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -16,7 +17,8 @@ class SharedMemory:
 
     Each session gets a directory under ~/.nanobot/swarm/<session_id>/.
     Agents write findings as markdown files; the orchestrator reads them
-    to build context for downstream agents.
+    to build context for downstream agents. Artifacts are mirrored in memory
+    (write-through), so reads never touch disk after the initial load.
     """
 
     def __init__(self, session_id: str, base_dir: Path | None = None):
@@ -24,39 +26,51 @@ class SharedMemory:
         self._base = base_dir or (Path.home() / ".nanobot" / "swarm")
         self.workspace = self._base / session_id
         self.workspace.mkdir(parents=True, exist_ok=True)
+        self._artifacts: dict[str, str] = self._load_artifacts()
+        self._briefing: str | None = None  # Cached, reset whenever an artifact changes
+
+    def _load_artifacts(self) -> dict[str, str]:
+        """Read artifacts left on disk by an earlier run of this session."""
+        with os.scandir(self.workspace) as entries:
+            return {
+                e.name[:-3]: Path(e.path).read_text(encoding="utf-8")
+                for e in entries
+                if e.name.endswith(".md") and e.is_file()
+            }
 
     def write(self, agent_name: str, key: str, content: str) -> Path:
         """Write an artifact from an agent. Returns the file path."""
         filename = f"{agent_name}.{key}.md"
         path = self.workspace / filename
         path.write_text(content, encoding="utf-8")
+        self._artifacts[path.stem] = content
+        self._briefing = None
         logger.debug("SharedMemory: {} wrote {}", agent_name, filename)
         return path
 
     def read(self, agent_name: str, key: str) -> str | None:
         """Read a specific artifact."""
-        path = self.workspace / f"{agent_name}.{key}.md"
-        if path.exists():
-            return path.read_text(encoding="utf-8")
-        return None
+        return self._artifacts.get(f"{agent_name}.{key}")
 
     def read_all(self) -> dict[str, str]:
         """Read all artifacts in this session."""
-        results = {}
-        for f in sorted(self.workspace.glob("*.md")):
-            results[f.stem] = f.read_text(encoding="utf-8")
-        return results
+        return dict(sorted(self._artifacts.items()))
 
     def get_briefing(self) -> str:
         """Generate a briefing of all current findings for agent context injection."""
+        if self._briefing is not None:
+            return self._briefing
+
         artifacts = self.read_all()
         if not artifacts:
-            return "(No prior findings yet.)"
+            self._briefing = "(No prior findings yet.)"
+            return self._briefing
 
         parts = ["# Prior findings from other agents\n"]
         for name, content in artifacts.items():
             parts.append(f"## {name}\n{content}\n")
-        return "\n".join(parts)
+        self._briefing = "\n".join(parts)
+        return self._briefing
 
     def write_task_graph(self, task_graph: dict[str, Any]) -> None:
         """Persist the task graph for debugging/inspection."""
@@ -67,9 +81,13 @@ class SharedMemory:
         """Write the final merged report."""
         path = self.workspace / "_final_report.md"
         path.write_text(report, encoding="utf-8")
+        self._artifacts[path.stem] = report
+        self._briefing = None
 
     def cleanup(self) -> None:
         """Remove the session workspace."""
         import shutil
         if self.workspace.exists():
             shutil.rmtree(self.workspace)
+        self._artifacts.clear()
+        self._briefing = None
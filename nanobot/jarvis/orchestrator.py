@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +16,13 @@ from nanobot.jarvis.memory import SharedMemory
 from nanobot.jarvis.pool import AgentPool, AgentResult
 from nanobot.jarvis.roles import RoleRegistry, RoleSpec
 
+# Rough per-role duration estimates (seconds), used to start long critical paths first
+_ROLE_COST_ESTIMATES = {"coder": 120.0, "qa": 30.0, "researcher": 20.0, "writer": 15.0}
+_DEFAULT_ROLE_COST = 20.0
+
+# Combined agent output below this size is merged by template instead of another LLM call
+_TEMPLATE_MERGE_MAX_CHARS = 2048
+
 
 class Orchestrator:
     """
@@ -33,6 +41,7 @@ class Orchestrator:
         agent_pool: AgentPool,
         model: str | None = None,
         max_tokens: int = 8192,
+        max_concurrency: int | None = None,
     ):
         self.provider = provider
         self.workspace = workspace
@@ -40,6 +49,10 @@ class Orchestrator:
         self.pool = agent_pool
         self.model = model or provider.get_default_model()
         self.max_tokens = max_tokens
+        # Agents mostly wait on the network, so allow a few per core even on small hosts
+        self.max_concurrency = max_concurrency or max(os.cpu_count() or 1, 4)
+        # Taken by AgentPool only for runs that start an agent; granted in launch order
+        self._agent_slots = asyncio.Semaphore(self.max_concurrency)
 
     async def handle(
         self,
@@ -161,62 +174,92 @@ Return ONLY valid JSON (no markdown fences, no explanation):
         shared_mem: SharedMemory,
         on_progress: Any = None,
     ) -> dict[str, AgentResult]:
-        """Execute the task graph respecting dependency order."""
+        """Execute the task graph, starting each task as soon as its dependencies finish."""
         completed: dict[str, AgentResult] = {}
-        pending = set(task_graph.keys())
-
-        while pending:
-            # Find ready tasks (all dependencies met)
-            ready = []
-            for tid in list(pending):
-                deps = task_graph[tid].get("depends", [])
-                if all(d in completed for d in deps):
-                    ready.append(tid)
-
-            if not ready:
-                logger.error("Deadlock in task graph! Remaining: {}", pending)
-                break
-
-            # Launch ready tasks in parallel
-            if on_progress:
-                role_names = [task_graph[tid]["role"] for tid in ready]
-                await on_progress(f"Running: {', '.join(role_names)}...")
-
-            coros = []
-            for tid in ready:
-                task_spec = task_graph[tid]
-                role = self.roles.get(task_spec["role"])
-                if not role:
-                    logger.warning("Unknown role '{}' for task {}, skipping", task_spec["role"], tid)
-                    completed[tid] = AgentResult(
-                        role=task_spec["role"], task_id=tid, task=task_spec["task"],
-                        output=f"Error: Unknown role '{task_spec['role']}'", status="error",
-                    )
-                    pending.discard(tid)
-                    continue
-
-                coros.append((tid, self.pool.run_agent(role, tid, task_spec["task"], shared_mem)))
-
-            if coros:
-                tasks = await asyncio.gather(
-                    *(coro for _, coro in coros), return_exceptions=True,
-                )
-                for (tid, _), result in zip(coros, tasks):
-                    if isinstance(result, Exception):
-                        completed[tid] = AgentResult(
-                            role=task_graph[tid]["role"], task_id=tid,
-                            task=task_graph[tid]["task"],
-                            output=f"Error: {result}", status="error",
-                        )
-                    else:
-                        completed[tid] = result
-                    pending.discard(tid)
-
-                    status = "completed" if not isinstance(result, Exception) and result.status == "ok" else "failed"
-                    logger.info("Task {} ({}): {}", tid, task_graph[tid]["role"], status)
 
+        # Order tasks topologically; any left out depend on a missing task or a cycle
+        successors: dict[str, list[str]] = {tid: [] for tid in task_graph}
+        indegree: dict[str, int] = {}
+        for tid, task_spec in task_graph.items():
+            deps = set(task_spec.get("depends", []))
+            indegree[tid] = len(deps)
+            for dep in deps:
+                if dep in successors:
+                    successors[dep].append(tid)
+        runnable = [tid for tid, n in indegree.items() if n == 0]
+        for tid in runnable:  # Grows while iterating
+            for succ in successors[tid]:
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    runnable.append(succ)
+
+        if len(runnable) < len(task_graph):
+            logger.error("Deadlock in task graph! Remaining: {}", set(task_graph) - set(runnable))
+
+        # Launch in critical-path order so long chains win contended agent slots
+        ranks = self._critical_path_ranks(task_graph, successors, runnable)
+        runnable.sort(key=lambda t: -ranks[t])
+        finished = {tid: asyncio.Event() for tid in runnable}
+
+        async def run_when_ready(tid: str) -> None:
+            try:
+                for dep in set(task_graph[tid].get("depends", [])):
+                    await finished[dep].wait()
+                completed[tid] = await self._run_task(tid, task_graph[tid], shared_mem, on_progress)
+            finally:
+                finished[tid].set()
+
+        await asyncio.gather(*(run_when_ready(tid) for tid in runnable))
         return completed
 
+    async def _run_task(
+        self,
+        tid: str,
+        task_spec: dict[str, Any],
+        shared_mem: SharedMemory,
+        on_progress: Any = None,
+    ) -> AgentResult:
+        """Run one task of the graph, turning failures into an error result."""
+        role = self.roles.get(task_spec["role"])
+        if not role:
+            logger.warning("Unknown role '{}' for task {}, skipping", task_spec["role"], tid)
+            return AgentResult(
+                role=task_spec["role"], task_id=tid, task=task_spec["task"],
+                output=f"Error: Unknown role '{task_spec['role']}'", status="error",
+            )
+
+        async def report_start() -> None:
+            await on_progress(f"Running: {role.name}...")
+
+        try:
+            result = await self.pool.run_agent(
+                role, tid, task_spec["task"], shared_mem,
+                slots=self._agent_slots, depends=task_spec.get("depends", []),
+                on_start=report_start if on_progress else None,
+            )
+        except Exception as e:
+            result = AgentResult(
+                role=task_spec["role"], task_id=tid, task=task_spec["task"],
+                output=f"Error: {e}", status="error",
+            )
+
+        status = "completed" if result.status == "ok" else "failed"
+        logger.info("Task {} ({}): {}", tid, task_spec["role"], status)
+        return result
+
+    @staticmethod
+    def _critical_path_ranks(
+        task_graph: dict[str, dict[str, Any]],
+        successors: dict[str, list[str]],
+        order: list[str],
+    ) -> dict[str, float]:
+        """Estimated duration of the longest path to the end, for tasks in topological `order`."""
+        ranks: dict[str, float] = {}
+        for tid in reversed(order):
+            cost = _ROLE_COST_ESTIMATES.get(task_graph[tid]["role"], _DEFAULT_ROLE_COST)
+            ranks[tid] = cost + max((ranks.get(s, 0.0) for s in successors[tid]), default=0.0)
+        return ranks
+
     async def _merge(
         self,
         user_request: str,
@@ -224,11 +267,25 @@ Return ONLY valid JSON (no markdown fences, no explanation):
         results: dict[str, AgentResult],
     ) -> str:
         """Merge all agent outputs into a final report."""
+        # Nothing ran: the whole graph was blocked by a cycle or a missing dependency
+        if not results:
+            return (
+                "No tasks could run: every planned task was blocked by a dependency "
+                "cycle or a missing dependency. Please try rephrasing the request."
+            )
+
         # If only one task, return its output directly
         if len(results) == 1:
             result = next(iter(results.values()))
             return result.output
 
+        # Short outputs read fine as-is; a synthesis call would mostly restate them
+        if sum(len(r.output) for r in results.values()) < _TEMPLATE_MERGE_MAX_CHARS:
+            return "\n\n".join(
+                f"## {r.role} ({tid})" + ("" if r.status == "ok" else " — FAILED") + f"\n{r.output}"
+                for tid, r in sorted(results.items())
+            )
+
         # Build summary of all results
         results_text = []
         for tid in sorted(results.keys()):
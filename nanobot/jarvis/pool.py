@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import json
 import shutil
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 from loguru import logger
 
 from nanobot.jarvis.memory import SharedMemory
 from nanobot.jarvis.roles import RoleSpec
 
+if TYPE_CHECKING:
+    from nanobot.agent.tools.base import Tool
+
 
 @dataclass
 class AgentResult:
@@ -37,6 +42,9 @@ class AgentPool:
     - Claude Code: shells out to `claude -p` for coding tasks (coder)
     """
 
+    _CLAUDE_STDOUT_MAX_BYTES = 256 * 1024
+    _CLAUDE_STDERR_MAX_BYTES = 16 * 1024
+
     def __init__(
         self,
         provider: Any,  # LLMProvider
@@ -56,6 +64,9 @@ class AgentPool:
         self.brave_api_key = brave_api_key
         self.exec_config = exec_config
         self.restrict_to_workspace = restrict_to_workspace
+        self._claude_bin: str | None = None  # Resolved on first successful lookup
+        self._tools: dict[str, Tool] | None = None  # Built once, shared by all LLM-loop agents
+        self._inflight: dict[str, asyncio.Future[AgentResult]] = {}  # Keyed by run identity
 
     async def run_agent(
         self,
@@ -63,8 +74,53 @@ class AgentPool:
         task_id: str,
         task: str,
         shared_mem: SharedMemory,
+        slots: asyncio.Semaphore | None = None,
+        depends: list[str] | None = None,
+        on_start: Callable[[], Awaitable[None]] | None = None,
     ) -> AgentResult:
-        """Run a single agent. Dispatches to Claude Code or LLM loop based on role config."""
+        """
+        Run a single agent. Dispatches to Claude Code or LLM loop based on role config.
+
+        An identical role + task with the same `depends` already running (or queued)
+        in the same swarm session is not started twice; the duplicate waits for it
+        and shares its output. If `slots` is given, only a run that actually starts
+        an agent holds one, so duplicates never count against the concurrency cap.
+        `on_start` is awaited once the agent actually starts, after any slot wait.
+        """
+        deps = ",".join(sorted(set(depends or [])))
+        key = hashlib.blake2b(
+            f"{shared_mem.session_id}\0{role.name}\0{deps}\0{task}".encode(), digest_size=16,
+        ).hexdigest()
+        if (running := self._inflight.get(key)) is not None:
+            logger.info("Agent {} task {} duplicates a running task, sharing its result",
+                        role.name, task_id)
+            result = await asyncio.shield(running)
+            if result.status == "ok":
+                shared_mem.write(role.name, task_id, result.output)
+            return replace(result, task_id=task_id)
+
+        future: asyncio.Future[AgentResult] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            async with slots or contextlib.nullcontext():
+                if on_start:
+                    await on_start()
+                result = await self._run_agent(role, task_id, task, shared_mem)
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+            if not future.done():
+                future.cancel()
+
+    async def _run_agent(
+        self,
+        role: RoleSpec,
+        task_id: str,
+        task: str,
+        shared_mem: SharedMemory,
+    ) -> AgentResult:
+        """Run one agent to completion, converting failures into an error result."""
         start = asyncio.get_event_loop().time()
 
         try:
@@ -109,10 +165,11 @@ class AgentPool:
 
         full_prompt = "\n".join(prompt_parts)
 
-        # Find claude CLI
-        claude_bin = shutil.which("claude")
+        # Find claude CLI (a miss is retried next time, in case it gets installed)
+        claude_bin = self._claude_bin or shutil.which("claude")
         if not claude_bin:
             return "Error: claude CLI not found in PATH. Install Claude Code first."
+        self._claude_bin = claude_bin
 
         logger.info("Coder agent delegating to Claude Code: {}", task[:80])
 
@@ -124,8 +181,13 @@ class AgentPool:
         )
 
         try:
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=600,  # 10 min max
+            (stdout, stdout_total), (stderr, _), _ = await asyncio.wait_for(
+                asyncio.gather(
+                    self._read_capped(proc.stdout, self._CLAUDE_STDOUT_MAX_BYTES),
+                    self._read_capped(proc.stderr, self._CLAUDE_STDERR_MAX_BYTES),
+                    proc.wait(),
+                ),
+                timeout=600,  # 10 min max
             )
         except asyncio.TimeoutError:
             proc.kill()
@@ -133,6 +195,8 @@ class AgentPool:
             raise
 
         output = stdout.decode("utf-8", errors="replace").strip()
+        if stdout_total > len(stdout):
+            output += f"\n... (truncated, {stdout_total} bytes total)"
         if proc.returncode != 0:
             err = stderr.decode("utf-8", errors="replace").strip()
             if err:
@@ -140,38 +204,61 @@ class AgentPool:
 
         return output or "(Claude Code returned empty output)"
 
-    async def _run_llm_loop(
-        self, role: RoleSpec, task: str, shared_mem: SharedMemory,
-    ) -> str:
-        """Run a standard LLM tool-use loop for non-coder agents."""
-        from nanobot.agent.tools.registry import ToolRegistry
+    @staticmethod
+    async def _read_capped(stream: asyncio.StreamReader, limit: int) -> tuple[bytes, int]:
+        """Drain a stream to EOF, keeping at most `limit` bytes. Returns (kept, total)."""
+        buf = bytearray()
+        total = 0
+        while chunk := await stream.read(64 * 1024):
+            total += len(chunk)
+            if len(buf) < limit:
+                buf += chunk[:limit - len(buf)]
+        return bytes(buf), total
+
+    def _get_tools(self) -> dict[str, Tool]:
+        """Return every swarm tool by role-config name, building them on first use.
+
+        The tools hold only construction-time config, so one instance of each
+        is safely shared by concurrent agents.
+        """
+        if self._tools is not None:
+            return self._tools
+
         from nanobot.agent.tools.filesystem import ReadFileTool, WriteFileTool, EditFileTool, ListDirTool
         from nanobot.agent.tools.shell import ExecTool
         from nanobot.agent.tools.web import WebSearchTool, WebFetchTool
         from nanobot.config.schema import ExecToolConfig
 
-        # Build tool registry based on role's allowed tools
-        tools = ToolRegistry()
         allowed_dir = self.workspace if self.restrict_to_workspace else None
         exec_cfg = self.exec_config or ExecToolConfig()
 
-        tool_map = {
-            "file_read": lambda: ReadFileTool(workspace=self.workspace, allowed_dir=allowed_dir),
-            "file_write": lambda: WriteFileTool(workspace=self.workspace, allowed_dir=allowed_dir),
-            "file_edit": lambda: EditFileTool(workspace=self.workspace, allowed_dir=allowed_dir),
-            "list_dir": lambda: ListDirTool(workspace=self.workspace, allowed_dir=allowed_dir),
-            "shell": lambda: ExecTool(
+        self._tools = {
+            "file_read": ReadFileTool(workspace=self.workspace, allowed_dir=allowed_dir),
+            "file_write": WriteFileTool(workspace=self.workspace, allowed_dir=allowed_dir),
+            "file_edit": EditFileTool(workspace=self.workspace, allowed_dir=allowed_dir),
+            "list_dir": ListDirTool(workspace=self.workspace, allowed_dir=allowed_dir),
+            "shell": ExecTool(
                 working_dir=str(self.workspace), timeout=exec_cfg.timeout,
                 restrict_to_workspace=self.restrict_to_workspace,
                 path_append=exec_cfg.path_append,
             ),
-            "web_search": lambda: WebSearchTool(api_key=self.brave_api_key),
-            "web_fetch": lambda: WebFetchTool(),
+            "web_search": WebSearchTool(api_key=self.brave_api_key),
+            "web_fetch": WebFetchTool(),
         }
+        return self._tools
+
+    async def _run_llm_loop(
+        self, role: RoleSpec, task: str, shared_mem: SharedMemory,
+    ) -> str:
+        """Run a standard LLM tool-use loop for non-coder agents."""
+        from nanobot.agent.tools.registry import ToolRegistry
 
+        # Build tool registry based on role's allowed tools
+        tools = ToolRegistry()
+        available = self._get_tools()
         for tool_name in role.tools:
-            if tool_name in tool_map:
-                tools.register(tool_map[tool_name]())
+            if tool_name in available:
+                tools.register(available[tool_name])
 
         # Build messages
         briefing = shared_mem.get_briefing()
@@ -222,10 +309,13 @@ class AgentPool:
                     "tool_calls": tool_call_dicts,
                 })
 
-                for tc in response.tool_calls:
+                for tc, call_dict in zip(response.tool_calls, tool_call_dicts):
                     logger.debug("Swarm agent [{}] tool: {}({})", role.name, tc.name,
-                                 json.dumps(tc.arguments, ensure_ascii=False)[:200])
-                    result = await tools.execute(tc.name, tc.arguments)
+                                 call_dict["function"]["arguments"][:200])
+                results = await tools.execute_many(
+                    [(tc.name, tc.arguments) for tc in response.tool_calls]
+                )
+                for tc, result in zip(response.tool_calls, results):
                     messages.append({
                         "role": "tool", "tool_call_id": tc.id,
                         "name": tc.name, "content": result,
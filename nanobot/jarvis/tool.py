@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any, TYPE_CHECKING
 
 from nanobot.agent.tools.base import Tool
@@ -9,12 +10,15 @@ from nanobot.agent.tools.base import Tool
 if TYPE_CHECKING:
     from nanobot.jarvis.orchestrator import Orchestrator
 
+# Anything but word characters (str.isalnum() or "_") and "-" is unsafe in a directory name
+_UNSAFE_ID_CHARS = re.compile(r"[^\w-]")
+
 
 class SwarmTool(Tool):
     """Tool that delegates complex tasks to the Jarvis agent swarm."""
 
-    def __init__(self, orchestrator: "Orchestrator"):
-        self._orchestrator = orchestrator
+    def __init__(self, orchestrator: Orchestrator):
+        self._orchestrator: Orchestrator = orchestrator
         self._origin_channel = "cli"
         self._origin_chat_id = "direct"
 
@@ -53,7 +57,7 @@ class SwarmTool(Tool):
         """Execute the swarm orchestration."""
         session_id = f"{self._origin_channel}_{self._origin_chat_id}"
         # Clean session_id for filesystem safety
-        session_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in session_id)
+        session_id = _UNSAFE_ID_CHARS.sub("_", session_id)
 
         result = await self._orchestrator.handle(
             user_request=task,
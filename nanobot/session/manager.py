@@ -1,6 +1,7 @@
 """Session management for conversation history."""
 
 import json
+import os
 import shutil
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -44,17 +45,19 @@ class Session:
     
     def get_history(self, max_messages: int = 500) -> list[dict[str, Any]]:
         """Return unconsolidated messages for LLM input, aligned to a user turn."""
-        unconsolidated = self.messages[self.last_consolidated:]
-        sliced = unconsolidated[-max_messages:]
+        # Index straight into the window instead of copying all unconsolidated messages first
+        start = self.last_consolidated
+        if max_messages:  # 0 keeps the whole unconsolidated history, as the [-0:] slice did
+            start = max(start, len(self.messages) - max_messages)
 
         # Drop leading non-user messages to avoid orphaned tool_result blocks
-        for i, m in enumerate(sliced):
-            if m.get("role") == "user":
-                sliced = sliced[i:]
+        for i in range(start, len(self.messages)):
+            if self.messages[i].get("role") == "user":
+                start = i
                 break
 
         out: list[dict[str, Any]] = []
-        for m in sliced:
+        for m in self.messages[start:]:
             entry: dict[str, Any] = {"role": m["role"], "content": m.get("content", "")}
             for k in ("tool_calls", "tool_call_id", "name"):
                 if k in m:
@@ -160,23 +163,36 @@ class SessionManager:
             return None
     
     def save(self, session: Session) -> None:
-        """Save a session to disk."""
-        path = self._get_session_path(session.key)
-
-        with open(path, "w", encoding="utf-8") as f:
-            metadata_line = {
-                "_type": "metadata",
-                "key": session.key,
-                "created_at": session.created_at.isoformat(),
-                "updated_at": session.updated_at.isoformat(),
-                "metadata": session.metadata,
-                "last_consolidated": session.last_consolidated
-            }
-            f.write(json.dumps(metadata_line, ensure_ascii=False) + "\n")
-            for msg in session.messages:
-                f.write(json.dumps(msg, ensure_ascii=False) + "\n")
-
+        """Save a session to disk, replacing the old file atomically."""
+        self.write(session.key, self.dumps(session))
         self._cache[session.key] = session
+
+    def dumps(self, session: Session) -> str:
+        """Serialize a session to its JSONL file contents."""
+        metadata_line = {
+            "_type": "metadata",
+            "key": session.key,
+            "created_at": session.created_at.isoformat(),
+            "updated_at": session.updated_at.isoformat(),
+            "metadata": session.metadata,
+            "last_consolidated": session.last_consolidated
+        }
+        lines = [json.dumps(metadata_line, ensure_ascii=False)]
+        lines.extend(json.dumps(msg, ensure_ascii=False) for msg in session.messages)
+        return "\n".join(lines) + "\n"
+
+    def write(self, key: str, data: str) -> None:
+        """Write serialized session contents to disk, replacing the old file atomically."""
+        path = self._get_session_path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
     def invalidate(self, key: str) -> None:
         """Remove a session from the in-memory cache."""
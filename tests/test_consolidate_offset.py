@@ -121,6 +121,13 @@ class TestSessionImmutableHistory:
         assert len(history) == 5
         assert history[0]["content"] == "msg0"
 
+    def test_get_history_zero_returns_all_unconsolidated(self) -> None:
+        """Test get_history with max_messages=0 returns every unconsolidated message."""
+        session = create_session_with_messages("test:zero", 5)
+        session.last_consolidated = 2
+        history = session.get_history(max_messages=0)
+        assert [m["content"] for m in history] == ["msg2", "msg3", "msg4"]
+
     def test_get_history_stable_for_same_session(self) -> None:
         """Test that get_history returns same content for same max_messages."""
         session = create_session_with_messages("test:stable", 20)
@@ -0,0 +1,325 @@
+"""Tests for the jarvis swarm shared memory and orchestration."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from nanobot.config.schema import SwarmConfig
+from nanobot.jarvis.memory import SharedMemory
+from nanobot.jarvis.orchestrator import Orchestrator
+from nanobot.jarvis.pool import AgentPool, AgentResult
+from nanobot.jarvis.roles import RoleRegistry, RoleSpec
+from nanobot.jarvis.tool import SwarmTool
+
+
+class _FakePool:
+    """Agent pool stand-in that records start/end order."""
+
+    def __init__(self, delays: dict[str, float] | None = None) -> None:
+        self.log: list[str] = []
+        self.delays = delays or {}
+
+    async def run_agent(
+        self, role, task_id, task, shared_mem, slots=None, depends=None, on_start=None,
+    ) -> AgentResult:
+        async with slots:
+            if on_start:
+                await on_start()
+            self.log.append(f"start {task_id}")
+            await asyncio.sleep(self.delays.get(task_id, 0.01))
+            self.log.append(f"end {task_id}")
+        return AgentResult(role=role.name, task_id=task_id, task=task, output=task, status="ok")
+
+
+def _make_orchestrator(tmp_path: Path, pool: _FakePool, **kwargs) -> Orchestrator:
+    roles = RoleRegistry(roles_dir=tmp_path / "no-roles")
+    for name in ("researcher", "coder", "qa", "writer"):
+        roles._roles[name] = RoleSpec(name=name, display_name=name)
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    return Orchestrator(
+        provider=provider, workspace=tmp_path, role_registry=roles, agent_pool=pool, **kwargs,
+    )
+
+
+def test_shared_memory_writes_through_to_disk(tmp_path: Path) -> None:
+    mem = SharedMemory("s1", base_dir=tmp_path)
+    path = mem.write("researcher", "t1", "found it")
+
+    assert path.read_text(encoding="utf-8") == "found it"
+    assert mem.read("researcher", "t1") == "found it"
+    assert mem.read("coder", "t2") is None
+
+
+def test_shared_memory_loads_existing_artifacts(tmp_path: Path) -> None:
+    SharedMemory("s1", base_dir=tmp_path).write("qa", "t2", "b")
+    (tmp_path / "s1" / "coder.t1.md").write_text("a", encoding="utf-8")
+
+    mem = SharedMemory("s1", base_dir=tmp_path)
+    assert mem.read_all() == {"coder.t1": "a", "qa.t2": "b"}
+
+
+def test_briefing_is_cached_until_next_write(tmp_path: Path) -> None:
+    mem = SharedMemory("s1", base_dir=tmp_path)
+    assert mem.get_briefing() == "(No prior findings yet.)"
+
+    mem.write("researcher", "t1", "alpha")
+    first = mem.get_briefing()
+    assert "## researcher.t1\nalpha" in first
+    assert mem.get_briefing() is first
+
+    mem.write("qa", "t2", "beta")
+    assert "## qa.t2\nbeta" in mem.get_briefing()
+
+
+async def test_dispatch_runs_dependents_after_their_dependencies(tmp_path: Path) -> None:
+    pool = _FakePool()
+    orch = _make_orchestrator(tmp_path, pool)
+    graph = {
+        "t1": {"role": "researcher", "task": "a", "depends": []},
+        "t2": {"role": "researcher", "task": "b", "depends": []},
+        "t3": {"role": "writer", "task": "c", "depends": ["t1", "t2"]},
+    }
+
+    results = await orch._dispatch(graph, SharedMemory("s1", base_dir=tmp_path))
+
+    assert set(results) == {"t1", "t2", "t3"}
+    assert pool.log.index("start t3") > max(pool.log.index("end t1"), pool.log.index("end t2"))
+
+
+async def test_dispatch_skips_tasks_with_unsatisfiable_dependencies(tmp_path: Path) -> None:
+    pool = _FakePool()
+    orch = _make_orchestrator(tmp_path, pool)
+    graph = {
+        "t1": {"role": "nobody", "task": "a", "depends": []},
+        "t2": {"role": "writer", "task": "b", "depends": ["t1"]},
+        "t3": {"role": "writer", "task": "c", "depends": ["missing"]},
+    }
+
+    results = await orch._dispatch(graph, SharedMemory("s1", base_dir=tmp_path))
+
+    assert results["t1"].status == "error"
+    assert results["t2"].status == "ok"
+    assert "t3" not in results
+
+
+def test_critical_path_ranks_follow_longest_downstream_chain() -> None:
+    graph = {
+        "t1": {"role": "writer", "task": "a", "depends": []},
+        "t2": {"role": "researcher", "task": "b", "depends": []},
+        "t3": {"role": "coder", "task": "c", "depends": ["t2"]},
+    }
+    successors = {"t1": [], "t2": ["t3"], "t3": []}
+
+    ranks = Orchestrator._critical_path_ranks(graph, successors, ["t1", "t2", "t3"])
+
+    assert ranks == {"t1": 15.0, "t2": 140.0, "t3": 120.0}
+
+
+async def test_dispatch_starts_longest_critical_path_first(tmp_path: Path) -> None:
+    pool = _FakePool()
+    orch = _make_orchestrator(tmp_path, pool)
+    graph = {
+        "t1": {"role": "writer", "task": "a", "depends": []},
+        "t2": {"role": "researcher", "task": "b", "depends": []},
+        "t3": {"role": "coder", "task": "c", "depends": ["t2"]},
+    }
+
+    await orch._dispatch(graph, SharedMemory("s1", base_dir=tmp_path))
+
+    assert pool.log[:2] == ["start t2", "start t1"]
+
+
+async def test_dispatch_caps_concurrent_agents(tmp_path: Path) -> None:
+    pool = _FakePool()
+    orch = _make_orchestrator(tmp_path, pool, max_concurrency=2)
+    graph = {f"t{i}": {"role": "researcher", "task": str(i), "depends": []} for i in range(4)}
+
+    await orch._dispatch(graph, SharedMemory("s1", base_dir=tmp_path))
+
+    running = peak = 0
+    for entry in pool.log:
+        running += 1 if entry.startswith("start") else -1
+        peak = max(peak, running)
+    assert peak == 2
+
+
+def test_agent_pool_builds_tools_once(tmp_path: Path) -> None:
+    pool = AgentPool(provider=MagicMock(), workspace=tmp_path)
+
+    tools = pool._get_tools()
+
+    assert pool._get_tools() is tools
+    assert tools["file_read"].read_only and not tools["shell"].read_only
+
+
+async def test_dispatch_starts_dependents_without_waiting_for_unrelated_tasks(
+    tmp_path: Path,
+) -> None:
+    pool = _FakePool(delays={"t1": 0.2})
+    orch = _make_orchestrator(tmp_path, pool)
+    graph = {
+        "t1": {"role": "coder", "task": "slow", "depends": []},
+        "t2": {"role": "researcher", "task": "fast", "depends": []},
+        "t3": {"role": "writer", "task": "next", "depends": ["t2"]},
+    }
+
+    await orch._dispatch(graph, SharedMemory("s1", base_dir=tmp_path))
+
+    assert pool.log.index("start t3") < pool.log.index("end t1")
+
+
+async def test_agent_pool_shares_identical_running_tasks(tmp_path: Path) -> None:
+    pool = AgentPool(provider=MagicMock(), workspace=tmp_path)
+    calls: list[str] = []
+
+    async def fake_llm_loop(role, task, shared_mem) -> str:
+        calls.append(task)
+        await asyncio.sleep(0.01)
+        return f"did {task}"
+
+    pool._run_llm_loop = fake_llm_loop
+    role = RoleSpec(name="researcher", display_name="Researcher")
+    mem = SharedMemory("s1", base_dir=tmp_path)
+
+    first, second, other = await asyncio.gather(
+        pool.run_agent(role, "t1", "look", mem),
+        pool.run_agent(role, "t2", "look", mem),
+        pool.run_agent(role, "t3", "elsewhere", mem),
+    )
+
+    assert calls == ["look", "elsewhere"]
+    assert (first.task_id, second.task_id) == ("t1", "t2")
+    assert first.output == second.output == "did look"
+    assert mem.read("researcher", "t2") == "did look"
+    assert not pool._inflight
+
+
+async def test_merge_joins_short_results_without_llm_call(tmp_path: Path) -> None:
+    orch = _make_orchestrator(tmp_path, _FakePool())
+    results = {
+        "t1": AgentResult(role="researcher", task_id="t1", task="a", output="fact", status="ok"),
+        "t2": AgentResult(role="coder", task_id="t2", task="b", output="boom", status="error"),
+    }
+
+    report = await orch._merge("request", {}, results)
+
+    assert report == "## researcher (t1)\nfact\n\n## coder (t2) — FAILED\nboom"
+    orch.provider.chat.assert_not_called()
+
+
+async def test_swarm_tool_sanitizes_session_id() -> None:
+    orchestrator = MagicMock()
+    orchestrator.handle = AsyncMock(return_value="report")
+    tool = SwarmTool(orchestrator)
+    tool.set_context("matrix", "!room:example.org/飞书")
+
+    assert await tool.execute(task="do it") == "report"
+    orchestrator.handle.assert_awaited_once_with(
+        user_request="do it", session_id="matrix__room_example_org_飞书",
+    )
+
+
+async def test_merge_reports_when_no_task_could_run(tmp_path: Path) -> None:
+    orch = _make_orchestrator(tmp_path, _FakePool())
+    graph = {
+        "t1": {"role": "researcher", "task": "a", "depends": ["t2"]},
+        "t2": {"role": "writer", "task": "b", "depends": ["t1"]},
+    }
+
+    results = await orch._dispatch(graph, SharedMemory("s1", base_dir=tmp_path))
+    report = await orch._merge("request", graph, results)
+
+    assert results == {}
+    assert report.startswith("No tasks could run")
+    orch.provider.chat.assert_not_called()
+
+
+async def test_duplicate_task_does_not_hold_a_concurrency_slot(tmp_path: Path) -> None:
+    pool = AgentPool(provider=MagicMock(), workspace=tmp_path)
+    log: list[str] = []
+
+    async def fake_llm_loop(role, task, shared_mem) -> str:
+        log.append(f"start {task}")
+        await asyncio.sleep(0.01)
+        log.append(f"end {task}")
+        return f"did {task}"
+
+    pool._run_llm_loop = fake_llm_loop
+    orch = _make_orchestrator(tmp_path, pool, max_concurrency=1)
+    graph = {
+        "t1": {"role": "researcher", "task": "look", "depends": []},
+        "t2": {"role": "researcher", "task": "look", "depends": []},
+        "t3": {"role": "researcher", "task": "other", "depends": []},
+    }
+
+    results = await orch._dispatch(graph, SharedMemory("s1", base_dir=tmp_path))
+
+    # The duplicate shares t1's run instead of queueing for the single slot
+    assert log == ["start look", "end look", "start other", "end other"]
+    assert results["t2"].output == "did look"
+
+
+async def test_same_task_with_different_dependencies_runs_again(tmp_path: Path) -> None:
+    pool = AgentPool(provider=MagicMock(), workspace=tmp_path)
+    calls: list[str] = []
+
+    async def fake_llm_loop(role, task, shared_mem) -> str:
+        slow = task == "run the tests" and task not in calls  # t1 outlives the fix
+        calls.append(task)
+        n = len(calls)
+        await asyncio.sleep(0.05 if slow else 0.01)
+        return f"{task} #{n}"
+
+    pool._run_llm_loop = fake_llm_loop
+    orch = _make_orchestrator(tmp_path, pool)
+    graph = {
+        "t1": {"role": "qa", "task": "run the tests", "depends": []},
+        "t2": {"role": "coder", "task": "fix X", "depends": []},
+        "t3": {"role": "qa", "task": "run the tests", "depends": ["t2"]},
+    }
+
+    results = await orch._dispatch(graph, SharedMemory("s1", base_dir=tmp_path))
+
+    # t3 verifies the fix, so it must not reuse t1's still-running pre-fix output
+    assert calls.count("run the tests") == 2
+    assert results["t3"].output != results["t1"].output
+
+
+async def test_progress_reports_running_only_once_a_slot_is_taken(tmp_path: Path) -> None:
+    pool = AgentPool(provider=MagicMock(), workspace=tmp_path)
+    log: list[str] = []
+
+    async def fake_llm_loop(role, task, shared_mem) -> str:
+        log.append(f"start {task}")
+        await asyncio.sleep(0.01)
+        log.append(f"end {task}")
+        return task
+
+    async def on_progress(message: str) -> None:
+        log.append(message)
+
+    pool._run_llm_loop = fake_llm_loop
+    orch = _make_orchestrator(tmp_path, pool, max_concurrency=1)
+    graph = {
+        "t1": {"role": "researcher", "task": "a", "depends": []},
+        "t2": {"role": "writer", "task": "b", "depends": []},
+    }
+
+    await orch._dispatch(graph, SharedMemory("s1", base_dir=tmp_path), on_progress)
+
+    # The writer waits for the single slot, so it is not reported as running before then
+    assert log == [
+        "Running: researcher...", "start a", "end a", "Running: writer...", "start b", "end b",
+    ]
+
+
+@pytest.mark.parametrize("value", [0, -1])
+def test_swarm_config_rejects_non_positive_concurrency(value: int) -> None:
+    with pytest.raises(ValidationError):
+        SwarmConfig(max_concurrency=value)
@@ -0,0 +1,158 @@
+"""Tests for session persistence from the agent loop."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nanobot.agent.loop import AgentLoop
+from nanobot.bus.events import InboundMessage
+from nanobot.bus.queue import MessageBus
+from nanobot.providers.base import LLMResponse
+from nanobot.session.manager import SessionManager
+
+
+def _make_loop(tmp_path: Path) -> AgentLoop:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    return AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path, model="test-model")
+
+
+@pytest.mark.asyncio
+async def test_write_behind_save_reaches_disk_after_flush(tmp_path: Path) -> None:
+    loop = _make_loop(tmp_path)
+    session = loop.sessions.get_or_create("cli:test")
+    session.add_message("user", "hello")
+
+    loop._schedule_save(session)
+    await loop.flush_sessions()
+
+    reloaded = SessionManager(tmp_path).get_or_create("cli:test")
+    assert [m["content"] for m in reloaded.messages] == ["hello"]
+    assert not loop._save_tasks
+
+
+@pytest.mark.asyncio
+async def test_write_behind_coalesces_bursts(tmp_path: Path) -> None:
+    loop = _make_loop(tmp_path)
+    session = loop.sessions.get_or_create("cli:test")
+    real_write = loop.sessions.write
+    loop.sessions.write = MagicMock(side_effect=real_write)
+
+    for i in range(5):
+        session.add_message("user", f"msg{i}")
+        loop._schedule_save(session)
+    await loop.flush_sessions()
+
+    assert loop.sessions.write.call_count == 1
+    reloaded = SessionManager(tmp_path).get_or_create("cli:test")
+    assert len(reloaded.messages) == 5
+
+
+@pytest.mark.asyncio
+async def test_save_requested_during_write_is_not_lost(tmp_path: Path) -> None:
+    loop = _make_loop(tmp_path)
+    session = loop.sessions.get_or_create("cli:test")
+    session.add_message("user", "first")
+    loop._schedule_save(session)
+    await asyncio.sleep(0)  # let the first write start
+
+    session.add_message("user", "second")
+    loop._schedule_save(session)
+    await loop.flush_sessions()
+
+    reloaded = SessionManager(tmp_path).get_or_create("cli:test")
+    assert [m["content"] for m in reloaded.messages] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_write_behind_snapshots_session_on_the_loop(tmp_path: Path) -> None:
+    loop = _make_loop(tmp_path)
+    session = loop.sessions.get_or_create("cli:test")
+    session.add_message("user", "first")
+    real_write = loop.sessions.write
+    started, release = threading.Event(), threading.Event()
+
+    def slow_write(key: str, data: str) -> None:
+        started.set()
+        release.wait(5)
+        real_write(key, data)
+
+    loop.sessions.write = slow_write
+    loop._schedule_save(session)
+    await asyncio.to_thread(started.wait, 5)
+    session.add_message("user", "second")  # Next turn mutates the session mid-write
+    session.metadata["new"] = True
+    release.set()
+    await loop.flush_sessions()
+
+    reloaded = SessionManager(tmp_path).get_or_create("cli:test")
+    assert [m["content"] for m in reloaded.messages] == ["first"]
+    assert reloaded.metadata == {}
+
+
+@pytest.mark.asyncio
+async def test_new_keeps_cached_session_when_save_fails(tmp_path: Path) -> None:
+    loop = _make_loop(tmp_path)
+    session = loop.sessions.get_or_create("cli:test")
+    session.add_message("user", "old")
+    session.last_consolidated = 1  # Nothing left to archive
+    loop.sessions.save(session)
+    loop.sessions.write = MagicMock(side_effect=OSError("disk full"))
+
+    msg = InboundMessage(channel="cli", sender_id="user", chat_id="test", content="/new")
+    with pytest.raises(OSError):
+        await loop._process_message(msg)
+
+    # The cleared session stays cached instead of being reloaded from the stale file
+    assert loop.sessions.get_or_create("cli:test").messages == []
+
+
+@pytest.mark.asyncio
+async def test_flush_sessions_now_writes_pending_saves(tmp_path: Path) -> None:
+    loop = _make_loop(tmp_path)
+    session = loop.sessions.get_or_create("cli:test")
+    session.add_message("user", "hello")
+    loop._schedule_save(session)
+
+    loop.flush_sessions_now()
+
+    reloaded = SessionManager(tmp_path).get_or_create("cli:test")
+    assert [m["content"] for m in reloaded.messages] == ["hello"]
+    await loop.flush_sessions()
+
+
+@pytest.mark.asyncio
+async def test_system_message_routes_to_origin_fields(tmp_path: Path) -> None:
+    loop = _make_loop(tmp_path)
+    loop.provider.chat = AsyncMock(return_value=LLMResponse(content="done"))
+    msg = InboundMessage(
+        channel="system", sender_id="subagent", chat_id="matrix:!room:example.org",
+        content="result", origin_channel="matrix", origin_chat_id="!room:example.org",
+    )
+
+    out = await loop._process_message(msg)
+    await loop.flush_sessions()
+
+    assert (out.channel, out.chat_id) == ("matrix", "!room:example.org")
+    assert loop.sessions.get_or_create("matrix:!room:example.org").messages
+
+
+def test_save_replaces_file_atomically(tmp_path: Path) -> None:
+    manager = SessionManager(tmp_path)
+    session = manager.get_or_create("cli:test")
+    session.add_message("user", "kept")
+    manager.save(session)
+
+    session.messages.append({"role": "user", "content": object()})  # Not JSON-serializable
+    with pytest.raises(TypeError):
+        manager.save(session)
+
+    path = manager._get_session_path("cli:test")
+    assert list(path.parent.glob("*.tmp")) == []
+    reloaded = SessionManager(tmp_path).get_or_create("cli:test")
+    assert [m["content"] for m in reloaded.messages] == ["kept"]
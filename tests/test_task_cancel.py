@@ -126,6 +126,34 @@ class TestDispatch:
         assert order == ["start-a", "end-a", "start-b", "end-b"]
 
 
+class TestRunLoop:
+    @pytest.mark.asyncio
+    async def test_stop_wakes_idle_run(self):
+        loop, bus = _make_loop()
+        run_task = asyncio.create_task(loop.run())
+        await asyncio.sleep(0.01)
+        loop.stop()
+        await asyncio.wait_for(run_task, timeout=0.5)
+        assert bus.inbound_size == 0
+
+    @pytest.mark.asyncio
+    async def test_run_dispatches_inbound(self):
+        from nanobot.bus.events import InboundMessage, OutboundMessage
+
+        loop, bus = _make_loop()
+        loop._process_message = AsyncMock(
+            return_value=OutboundMessage(channel="test", chat_id="c1", content="hi")
+        )
+        run_task = asyncio.create_task(loop.run())
+        await bus.publish_inbound(
+            InboundMessage(channel="test", sender_id="u1", chat_id="c1", content="hello")
+        )
+        out = await asyncio.wait_for(bus.consume_outbound(), timeout=1.0)
+        assert out.content == "hi"
+        loop.stop()
+        await asyncio.wait_for(run_task, timeout=0.5)
+
+
 class TestSubagentCancellation:
     @pytest.mark.asyncio
     async def test_cancel_by_session(self):
@@ -1,7 +1,11 @@
+import asyncio
 from typing import Any
 
+import httpx
+
 from nanobot.agent.tools.base import Tool
 from nanobot.agent.tools.registry import ToolRegistry
+from nanobot.agent.tools.web import WebFetchTool
 
 
 class SampleTool(Tool):
@@ -86,3 +90,99 @@ async def test_registry_returns_validation_error() -> None:
     reg.register(SampleTool())
     result = await reg.execute("sample", {"query": "hi"})
     assert "Invalid parameters" in result
+
+
+def test_registry_definitions_cached_until_registry_changes() -> None:
+    reg = ToolRegistry()
+    reg.register(SampleTool())
+    first = reg.get_definitions()
+    second = reg.get_definitions()
+    assert first == second
+    assert first[0] is second[0]
+
+    reg.unregister("sample")
+    assert reg.get_definitions() == []
+    reg.register(SampleTool())
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["sample"]
+
+
+class _RecordingTool(Tool):
+    def __init__(self, name: str, log: list[str], read_only: bool) -> None:
+        self._name = name
+        self._log = log
+        self.read_only = read_only
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._name
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return {"type": "object", "properties": {"v": {"type": "string"}}}
+
+    async def execute(self, v: str = "", **kwargs: Any) -> str:
+        self._log.append(f"start {self._name}:{v}")
+        await asyncio.sleep(0.01)
+        self._log.append(f"end {self._name}:{v}")
+        return f"{self._name}:{v}"
+
+
+async def test_execute_many_overlaps_read_only_calls_and_keeps_order() -> None:
+    log: list[str] = []
+    reg = ToolRegistry()
+    reg.register(_RecordingTool("read", log, read_only=True))
+    reg.register(_RecordingTool("write", log, read_only=False))
+
+    results = await reg.execute_many([
+        ("read", {"v": "a"}), ("read", {"v": "b"}), ("write", {"v": "c"}), ("read", {"v": "d"}),
+    ])
+
+    assert results == ["read:a", "read:b", "write:c", "read:d"]
+    # The two leading reads overlap; the write runs alone before the last read starts
+    assert log[:2] == ["start read:a", "start read:b"]
+    assert log[4:] == ["start write:c", "end write:c", "start read:d", "end read:d"]
+
+
+async def test_execute_many_memo_reuses_reads_until_a_write() -> None:
+    log: list[str] = []
+    reg = ToolRegistry()
+    reg.register(_RecordingTool("read", log, read_only=True))
+    reg.register(_RecordingTool("write", log, read_only=False))
+    memo: dict[tuple[str, str], str] = {}
+
+    first = await reg.execute_many([("read", {"v": "a"}), ("read", {"v": "a"})], memo=memo)
+    second = await reg.execute_many([("read", {"v": "a"})], memo=memo)
+    assert first == second + second == ["read:a", "read:a"]
+    assert log.count("start read:a") == 1
+
+    await reg.execute_many([("write", {"v": "b"}), ("read", {"v": "a"})], memo=memo)
+    assert log.count("start read:a") == 2
+
+
+async def test_execute_many_memo_retries_web_fetch_errors() -> None:
+    statuses = iter([503, 200])
+    hits: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        hits.append(status)
+        return httpx.Response(status, json={"ok": status == 200})
+
+    reg = ToolRegistry()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        reg.register(WebFetchTool(client=client))
+        memo: dict[tuple[str, str], str] = {}
+        call = [("web_fetch", {"url": "https://example.com/"})]
+
+        failed = await reg.execute_many(call, memo=memo)
+        retried = await reg.execute_many(call, memo=memo)
+        cached = await reg.execute_many(call, memo=memo)
+
+    assert '"error"' in failed[0]
+    assert '"status": 200' in retried[0]
+    assert cached == retried
+    assert hits == [503, 200]
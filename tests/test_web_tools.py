@@ -0,0 +1,51 @@
+"""Tests for the web tools' shared HTTP client."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+
+from nanobot.agent.loop import AgentLoop
+from nanobot.agent.tools.web import WebFetchTool, new_http_client
+from nanobot.bus.queue import MessageBus
+
+
+async def test_shared_client_does_not_carry_cookies_between_fetches() -> None:
+    seen_cookies: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_cookies.append(request.headers.get("cookie"))
+        return httpx.Response(200, json={}, headers={"set-cookie": "sid=userA; Path=/"})
+
+    async with new_http_client(transport=httpx.MockTransport(handler)) as client:
+        tool = WebFetchTool(client=client)
+        await tool.execute(url="https://example.com/a")
+        await tool.execute(url="https://example.com/b")
+        assert len(client.cookies) == 0
+
+    assert seen_cookies == [None, None]
+
+
+async def test_shared_client_stays_open_across_calls() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"n": 1}))
+    async with new_http_client(transport=transport) as client:
+        tool = WebFetchTool(client=client)
+        for _ in range(2):
+            result = json.loads(await tool.execute(url="https://example.com/"))
+            assert result["status"] == 200
+        assert not client.is_closed
+
+
+async def test_agent_loop_shares_one_client_between_web_tools(tmp_path: Path) -> None:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    loop = AgentLoop(bus=MessageBus(), provider=provider, workspace=tmp_path, model="test-model")
+
+    search, fetch = loop.tools.get("web_search"), loop.tools.get("web_fetch")
+    assert search._client is fetch._client is loop._http_client
+
+    await loop.close()
+    assert loop._http_client.is_closed